@@ -1,47 +1,183 @@
 
+import argparse
+import hashlib
+import ipaddress
+import json
 import os
+import re
+import socket
 import sys
-import requests
-from rich.console import Console
-from rich.table import Table
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+import orjson
 from dotenv import load_dotenv
 
+# requests and rich are slow to import, so they are imported where they are
+# used; argument parsing (e.g. --help) does not pay for them.
+if TYPE_CHECKING:
+    import requests
+
 # Load environment variables from .env file
 load_dotenv()
 
 # --- Configuration ---
 CF_EMAIL = os.getenv("CF_EMAIL")
 CF_GLOBAL_API_KEY = os.getenv("CF_GLOBAL_API_KEY")
+# A scoped API token is preferred; the email + global API key pair is kept
+# as a fallback for existing setups.
+CF_API_TOKEN = os.getenv("CF_API_TOKEN")
 
 # --- Cloudflare API Setup ---
 API_BASE_URL = "https://api.cloudflare.com/client/v4"
+if CF_API_TOKEN:
+    AUTH_HEADERS = {"Authorization": f"Bearer {CF_API_TOKEN}"}
+else:
+    AUTH_HEADERS = {"X-Auth-Email": CF_EMAIL, "X-Auth-Key": CF_GLOBAL_API_KEY}
 HEADERS = {
-    "X-Auth-Email": CF_EMAIL,
-    "X-Auth-Key": CF_GLOBAL_API_KEY,
-    "Content-Type": "application/json"
+    **AUTH_HEADERS,
+    "Content-Type": "application/json",
 }
 
+# Linux constant, not exported by the socket module
+TCP_FASTOPEN_CONNECT = 30
+
+# Upper bound on in-flight requests for bulk deletes and record page fetches.
+# requests only speaks HTTP/1.1, so concurrent calls each need their own pooled
+# connection; the pool is sized to match so every worker can keep one alive.
+MAX_CONCURRENT_REQUESTS = 10
+
+# Shared session so every API call reuses the same keep-alive connection pool,
+# created on first use by get_session()
+_session = None
+
+# Zone IDs practically never change, so the zone list is cached on disk
+ZONE_CACHE_TTL = 24 * 60 * 60
+
+# Record listings are reused between adjacent menu actions for a short time
+RECORDS_CACHE_TTL = 30
+_records_cache = {"zone_id": None, "ts": 0, "data": None}
+
+# Cloudflare paginates record listings (100 per page by default)
+RECORDS_PER_PAGE = 500
+
 # --- Rich Console ---
-console = Console()
+# Created in main()
+console = None
+
+def _socket_options():
+    """Socket options for API connections: urllib3's defaults plus TCP Fast Open where the kernel supports it."""
+    from urllib3.connection import HTTPConnection
+
+    options = list(HTTPConnection.default_socket_options)
+    if sys.platform.startswith("linux"):
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+                probe.setsockopt(socket.IPPROTO_TCP, TCP_FASTOPEN_CONNECT, 1)
+        except OSError:
+            return options
+        options.append((socket.IPPROTO_TCP, TCP_FASTOPEN_CONNECT, 1))
+    return options
+
+def get_session():
+    """Return the shared requests session, creating it on first use."""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        class _APIAdapter(HTTPAdapter):
+            def init_poolmanager(self, *args, **kwargs):
+                kwargs["socket_options"] = _socket_options()
+                super().init_poolmanager(*args, **kwargs)
+
+        _session = requests.Session()
+        _session.headers.update(HEADERS)
+        _session.mount("https://", _APIAdapter(pool_connections=4, pool_maxsize=MAX_CONCURRENT_REQUESTS))
+    return _session
+
+def _zone_cache_path():
+    """Location of the on-disk zone cache."""
+    return Path.home() / ".cache" / "cf-dns-cli" / "zones.json"
+
+def _zone_cache_key():
+    """Cache key for the current credentials; tokens are hashed so they never hit the disk."""
+    if CF_API_TOKEN:
+        return "token:" + hashlib.sha256(CF_API_TOKEN.encode()).hexdigest()[:16]
+    return CF_EMAIL
+
+def _read_zone_cache():
+    """Read the whole zone cache file, returning {} if it is missing or malformed."""
+    try:
+        with open(_zone_cache_path()) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def _is_valid_zone_entry(entry):
+    """Check that a cache entry has the shape written by _save_cached_zones()."""
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("fetched_at"), (int, float))
+        and isinstance(entry.get("zones"), list)
+        and all(isinstance(zone, dict) and "id" in zone and "name" in zone for zone in entry["zones"])
+    )
+
+def _load_cached_zones():
+    """Return the cached zones for this account, or None if missing, malformed or expired."""
+    entry = _read_zone_cache().get(_zone_cache_key())
+    if _is_valid_zone_entry(entry) and entry["fetched_at"] + ZONE_CACHE_TTL > time.time():
+        return entry["zones"]
+    return None
+
+def _save_cached_zones(zones):
+    """Store the zone list for this account, replacing the cache file atomically."""
+    path = _zone_cache_path()
+    cache = _read_zone_cache()
+    cache[_zone_cache_key()] = {
+        "zones": [{"id": zone["id"], "name": zone["name"]} for zone in zones],
+        "fetched_at": time.time(),
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+def get_all_zones(refresh=False):
+    """Get all zones (domains) from the Cloudflare account, using the disk cache unless refresh is set."""
+    import requests
+
+    if not refresh:
+        zones = _load_cached_zones()
+        if zones:
+            return zones
 
-def get_all_zones():
-    """Get all zones (domains) from the Cloudflare account."""
     url = f"{API_BASE_URL}/zones"
     try:
-        response = requests.get(url, headers=HEADERS)
+        response = get_session().get(url)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         if data["result"]:
+            _save_cached_zones(data["result"])
             return data["result"]
         else:
             console.print(f"[bold red]Error: No domains found in your Cloudflare account.[/bold red]")
             sys.exit(1)
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         console.print(f"[bold red]API Request Error: {e}[/bold red]")
         sys.exit(1)
 
 def select_zone(zones):
     """Display a list of zones and prompt the user to select one."""
+    from rich.table import Table
+
     table = Table(title="Select a Domain to Manage")
     table.add_column("ID", style="cyan", no_wrap=True)
     table.add_column("Domain", style="green")
@@ -62,107 +198,305 @@ def select_zone(zones):
             console.print("[bold red]Invalid input. Please enter a number.[/bold red]")
 
 
-def get_dns_records(zone_id):
-    """Get all DNS records for a given Zone ID."""
+def _format_api_error(e: "requests.exceptions.RequestException") -> str:
+    """Return Cloudflare's error message for a failed request, or the exception text."""
+    if e.response is None:
+        return str(e)
+    try:
+        errors = orjson.loads(e.response.content).get("errors") or [{}]
+    except (orjson.JSONDecodeError, AttributeError):
+        return str(e)
+    return errors[0].get("message", str(e))
+
+def invalidate_records_cache():
+    """Drop the cached record listing after a change to the zone."""
+    _records_cache["data"] = None
+
+def _fetch_dns_records_page(zone_id, page):
+    """Fetch one page of a zone's DNS record listing."""
     url = f"{API_BASE_URL}/zones/{zone_id}/dns_records"
+    response = get_session().get(url, params={"page": page, "per_page": RECORDS_PER_PAGE})
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+def _iter_dns_record_pages(zone_id):
+    """Yield the DNS records of a zone one page at a time.
+
+    The first page tells how many pages there are; the rest are fetched concurrently.
+    """
+    first = _fetch_dns_records_page(zone_id, 1)
+    yield first["result"]
+    total_pages = first["result_info"]["total_pages"]
+    if total_pages > 1:
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            pages = executor.map(lambda page: _fetch_dns_records_page(zone_id, page)["result"],
+                                 range(2, total_pages + 1))
+            yield from pages
+
+def get_dns_records(zone_id):
+    """Get all DNS records for a given Zone ID, reusing a recent listing if there is one."""
+    import requests
+
+    if (_records_cache["data"] is not None and _records_cache["zone_id"] == zone_id
+            and time.time() - _records_cache["ts"] < RECORDS_CACHE_TTL):
+        return _records_cache["data"]
+
+    records = []
     try:
-        response = requests.get(url, headers=HEADERS)
-        response.raise_for_status()
-        return response.json()["result"]
-    except requests.exceptions.RequestException as e:
+        with console.status("Fetching DNS records..."):
+            for page in _iter_dns_record_pages(zone_id):
+                records.extend(page)
+        _records_cache.update(zone_id=zone_id, ts=time.time(), data=records)
+        return records
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         console.print(f"[bold red]API Request Error: {e}[/bold red]")
         return []
 
+def get_dns_record(zone_id, record_id):
+    """Get a single DNS record by ID, or None if it cannot be fetched."""
+    import requests
+
+    url = f"{API_BASE_URL}/zones/{zone_id}/dns_records/{record_id}"
+    try:
+        response = get_session().get(url)
+        response.raise_for_status()
+        return orjson.loads(response.content)["result"]
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+        console.print(f"[bold red]API Request Error: {e}[/bold red]")
+        return None
+
+# Column schema of the DNS records table: (header, style, no_wrap)
+_RECORD_COLUMNS = (
+    ("ID", "cyan", True),
+    ("Type", "magenta", False),
+    ("Name", "green", False),
+    ("Content", "yellow", False),
+    ("TTL", "blue", False),
+    ("Priority", "yellow", False),
+    ("Proxy", "red", False),
+)
+_PROXY_LABELS = ("Off", "On")
+
 def display_dns_records(records, domain):
     """Display DNS records in a formatted table."""
+    from rich.table import Table
+
     table = Table(title=f"DNS Records for {domain}")
-    table.add_column("ID", style="cyan", no_wrap=True)
-    table.add_column("Type", style="magenta")
-    table.add_column("Name", style="green")
-    table.add_column("Content", style="yellow")
-    table.add_column("TTL", style="blue")
-    table.add_column("Priority", style="yellow")
-    table.add_column("Proxy", style="red")
+    for header, style, no_wrap in _RECORD_COLUMNS:
+        table.add_column(header, style=style, no_wrap=no_wrap)
 
+    add_row = table.add_row
     for record in records:
-        table.add_row(
+        add_row(
             record["id"],
             record["type"],
             record["name"],
             record["content"],
             str(record["ttl"]),
             str(record.get("priority", "N/A")),
-            "On" if record["proxied"] else "Off"
+            _PROXY_LABELS[bool(record["proxied"])]
         )
     console.print(table)
 
+def prompt_record_id(zone_id, domain, action):
+    """Ask for a record ID, listing the zone's records first only if the user asks to.
+
+    Returns (record_id, records_by_id); record_id is None if no valid ID was given and
+    records_by_id is None when the listing was skipped.
+    """
+    record_id = console.input(f"\nEnter the ID of the record to {action} (or 'list' to list records first): ").strip()
+    if record_id.lower() != 'list':
+        return record_id or None, None
+
+    records = get_dns_records(zone_id)
+    if not records:
+        return None, None
+    records_by_id = {r["id"]: r for r in records}
+    display_dns_records(records_by_id.values(), domain)
+    record_id = console.input(f"\nEnter the ID of the record to {action}: ").strip()
+    if record_id not in records_by_id:
+        console.print("[bold red]Record ID not found.[/bold red]")
+        return None, None
+    return record_id, records_by_id
+
+# Record types Cloudflare accepts through the DNS records API
+VALID_TYPES = frozenset({
+    "A", "AAAA", "CAA", "CERT", "CNAME", "DNSKEY", "DS", "HTTPS", "LOC", "MX", "NAPTR",
+    "NS", "OPENPGPKEY", "PTR", "SMIMEA", "SRV", "SSHFP", "SVCB", "TLSA", "TXT", "URI",
+})
+
+_HOSTNAME_RE = re.compile(r"^[A-Za-z0-9._-]+$")
+
+def _validate(record_type, name, content, ttl):
+    """Check a record locally before sending it. Returns (ok, error_message)."""
+    if not name:
+        return False, "Name must not be empty."
+    if record_type in ("A", "AAAA"):
+        try:
+            address = ipaddress.ip_address(content)
+        except ValueError:
+            return False, f"'{content}' is not a valid IP address."
+        if address.version != (4 if record_type == "A" else 6):
+            return False, f"'{content}' is not a valid IPv{4 if record_type == 'A' else 6} address."
+    elif record_type in ("CNAME", "MX", "NS") and not _HOSTNAME_RE.match(content):
+        return False, f"'{content}' is not a valid hostname."
+    if ttl != 1 and not 60 <= ttl <= 86400:
+        return False, "TTL must be 1 (auto) or between 60 and 86400 seconds."
+    return True, None
+
+def _keep_text(label, value):
+    """Return a text prompt answer unchanged."""
+    return value
+
+def _parse_int(label, value):
+    """Convert a prompt answer to an int, raising ValueError with a readable message."""
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"The {label} must be a whole number.") from None
+
+def _prompt_field(label, default=None, cast=_keep_text, updating=False):
+    """Prompt for a field value; when updating, empty input keeps default (which may be None)."""
+    if not updating:
+        return cast(label, console.input(f"Enter {label}: "))
+    value = console.input(f"Enter new {label} ({'' if default is None else default}): ")
+    return cast(label, value) if value else default
+
+def _collect_mx_extras(data, defaults):
+    """Add the priority of an MX record to the request data."""
+    priority = _prompt_field("priority", defaults.get("priority"), _parse_int, updating=bool(defaults))
+    if priority is not None:
+        data["priority"] = priority
+
+def _collect_srv_extras(data, defaults):
+    """Add the priority, weight, port and target of an SRV record to the request data."""
+    current = defaults.get("data", {})
+    updating = bool(defaults)
+    data["data"] = {
+        "priority": _prompt_field("priority", current.get("priority"), _parse_int, updating),
+        "weight": _prompt_field("weight", current.get("weight"), _parse_int, updating),
+        "port": _prompt_field("port", current.get("port"), _parse_int, updating),
+        "target": _prompt_field("target", current.get("target"), updating=updating),
+    }
+
+def _no_extras(data, defaults):
+    """Record types without fields beyond type, name, content and TTL."""
+
+# Per-type prompts for extra fields, each handler receives (data, defaults) and
+# fills in data; defaults is the existing record when updating, else {}.
+_TYPE_HANDLERS: dict[str, Callable[[dict, dict], None]] = {
+    "MX": _collect_mx_extras,
+    "SRV": _collect_srv_extras,
+}
+
+# Types whose handler sends structured data; Cloudflare builds their content from it
+_TYPES_WITHOUT_CONTENT = frozenset({"SRV"})
+
 def add_dns_record(zone_id, domain):
     """Add a new DNS record."""
+    import requests
+
     console.print("\n[bold]Add a new DNS Record[/bold]")
-    record_type = console.input("Enter record type (A, AAAA, CNAME, TXT, etc.): ").upper()
+    record_type = console.input("Enter record type (A, AAAA, CNAME, TXT, etc.): ").strip().upper()
+    if record_type not in VALID_TYPES:
+        console.print(f"[bold red]Unsupported record type: {record_type}[/bold red]")
+        return
     name = console.input(f"Enter name (e.g., 'subdomain' for subdomain.{domain}): ")
-    content = console.input("Enter content (e.g., IP address or another domain): ")
+    content = None
+    if record_type not in _TYPES_WITHOUT_CONTENT:
+        content = console.input("Enter content (e.g., IP address or another domain): ")
     ttl_str = console.input("Enter TTL (in seconds, 1 for auto): ")
-    ttl = int(ttl_str) if ttl_str else 1
+    try:
+        ttl = _parse_int("TTL", ttl_str) if ttl_str else 1
+    except ValueError as e:
+        console.print(f"[bold red]Invalid DNS record: {e}[/bold red]")
+        return
+
+    ok, error_message = _validate(record_type, name, content, ttl)
+    if not ok:
+        console.print(f"[bold red]Invalid DNS record: {error_message}[/bold red]")
+        return
     
     data = {
         "type": record_type,
         "name": name,
-        "content": content,
         "ttl": ttl,
     }
+    if content is not None:
+        data["content"] = content
+
+    try:
+        _TYPE_HANDLERS.get(record_type, _no_extras)(data, {})
+    except ValueError as e:
+        console.print(f"[bold red]Invalid DNS record: {e}[/bold red]")
+        return
 
-    if record_type == 'MX':
-        priority = int(console.input("Enter priority: "))
-        data["priority"] = priority
-    
     proxied_input = console.input("Enable Cloudflare proxy? (yes/no): ").lower()
     proxied = proxied_input == 'yes'
     data["proxied"] = proxied
 
     url = f"{API_BASE_URL}/zones/{zone_id}/dns_records"
     try:
-        response = requests.post(url, headers=HEADERS, json=data)
+        response = get_session().post(url, data=orjson.dumps(data))
         response.raise_for_status()
+        invalidate_records_cache()
         console.print("\n[bold green]Successfully added DNS record.[/bold green]")
     except requests.exceptions.RequestException as e:
-        error_message = e.response.json()["errors"][0]["message"]
+        error_message = _format_api_error(e)
         console.print(f"[bold red]Error adding DNS record: {error_message}[/bold red]")
 
 
-def update_dns_record(zone_id, records, domain):
+def update_dns_record(zone_id, domain):
     """Update an existing DNS record."""
-    display_dns_records(records, domain)
-    record_id = console.input("\nEnter the ID of the record to update: ")
+    import requests
+
+    record_id, records_by_id = prompt_record_id(zone_id, domain, "update")
+    if not record_id:
+        return
 
     # Find the record to pre-fill information
-    record_to_update = next((r for r in records if r['id'] == record_id), None)
+    record_to_update = records_by_id[record_id] if records_by_id else get_dns_record(zone_id, record_id)
     if not record_to_update:
-        console.print("[bold red]Record ID not found.[/bold red]")
         return
 
     console.print("\n[bold]Update DNS Record[/bold] (press Enter to keep current value)")
 
-    record_type = console.input(f"Enter new type ({record_to_update['type']}): ") or record_to_update['type']
+    record_type = console.input(f"Enter new type ({record_to_update['type']}): ").strip().upper()
+    if not record_type:
+        # Keep the type the API returned, even if it is not in VALID_TYPES
+        record_type = record_to_update['type']
+    elif record_type not in VALID_TYPES:
+        console.print(f"[bold red]Unsupported record type: {record_type}[/bold red]")
+        return
     name = console.input(f"Enter new name ({record_to_update['name']}): ") or record_to_update['name']
-    content = console.input(f"Enter new content ({record_to_update['content']}): ") or record_to_update['content']
+    content = None
+    if record_type not in _TYPES_WITHOUT_CONTENT:
+        content = console.input(f"Enter new content ({record_to_update['content']}): ") or record_to_update['content']
     ttl_str = console.input(f"Enter new TTL ({record_to_update['ttl']}): ")
-    ttl = int(ttl_str) if ttl_str else record_to_update['ttl']
+    try:
+        ttl = _parse_int("TTL", ttl_str) if ttl_str else record_to_update['ttl']
+    except ValueError as e:
+        console.print(f"[bold red]Invalid DNS record: {e}[/bold red]")
+        return
+
+    ok, error_message = _validate(record_type, name, content, ttl)
+    if not ok:
+        console.print(f"[bold red]Invalid DNS record: {error_message}[/bold red]")
+        return
     
     data = {
         "type": record_type,
         "name": name,
-        "content": content,
         "ttl": ttl,
     }
+    if content is not None:
+        data["content"] = content
 
-    if record_type == 'MX':
-        default_priority = record_to_update.get('priority', '')
-        priority_str = console.input(f"Enter new priority ({default_priority}): ")
-        if priority_str:
-            data["priority"] = int(priority_str)
-        elif default_priority:
-            data["priority"] = default_priority
+    try:
+        _TYPE_HANDLERS.get(record_type, _no_extras)(data, record_to_update)
+    except ValueError as e:
+        console.print(f"[bold red]Invalid DNS record: {e}[/bold red]")
+        return
 
     proxied_input = console.input(f"Enable Cloudflare proxy? ({'yes' if record_to_update['proxied'] else 'no'}): ").lower()
     proxied = (proxied_input == 'yes') if proxied_input else record_to_update['proxied']
@@ -171,79 +505,223 @@ def update_dns_record(zone_id, records, domain):
 
     url = f"{API_BASE_URL}/zones/{zone_id}/dns_records/{record_id}"
     try:
-        response = requests.put(url, headers=HEADERS, json=data)
+        response = get_session().put(url, data=orjson.dumps(data))
         response.raise_for_status()
+        invalidate_records_cache()
         console.print("\n[bold green]Successfully updated DNS record.[/bold green]")
     except requests.exceptions.RequestException as e:
-        error_message = e.response.json()["errors"][0]["message"]
+        error_message = _format_api_error(e)
         console.print(f"[bold red]Error updating DNS record: {error_message}[/bold red]")
 
-def delete_dns_record(zone_id, records, domain):
+def delete_dns_record(zone_id, domain):
     """Delete a DNS record."""
-    display_dns_records(records, domain)
-    record_id = console.input("\nEnter the ID of the record to delete: ")
+    import requests
 
-    if not any(r['id'] == record_id for r in records):
-        console.print("[bold red]Record ID not found.[/bold red]")
+    record_id, _ = prompt_record_id(zone_id, domain, "delete")
+    if not record_id:
         return
 
     confirmation = console.input(f"Are you sure you want to delete record {record_id}? (yes/no): ").lower()
     if confirmation == 'yes':
         url = f"{API_BASE_URL}/zones/{zone_id}/dns_records/{record_id}"
         try:
-            response = requests.delete(url, headers=HEADERS)
+            response = get_session().delete(url)
             response.raise_for_status()
+            invalidate_records_cache()
             console.print("\n[bold green]Successfully deleted DNS record.[/bold green]")
         except requests.exceptions.RequestException as e:
-            console.print(f"[bold red]Error deleting DNS record: {e}[/bold red]")
+            console.print(f"[bold red]Error deleting DNS record: {_format_api_error(e)}[/bold red]")
+    else:
+        console.print("Deletion cancelled.")
+
+def _delete_one(zone_id, record_id):
+    """Delete a single record, returning an error string or None on success."""
+    import requests
+
+    url = f"{API_BASE_URL}/zones/{zone_id}/dns_records/{record_id}"
+    try:
+        response = get_session().delete(url)
+        response.raise_for_status()
+        return None
+    except requests.exceptions.RequestException as e:
+        return _format_api_error(e)
+
+def delete_dns_records(zone_id, record_ids):
+    """Delete several records concurrently. Returns a list of (record_id, error) failures."""
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        errors = list(executor.map(lambda record_id: _delete_one(zone_id, record_id), record_ids))
+    return [(record_id, error) for record_id, error in zip(record_ids, errors) if error]
+
+def _select_records_by_filter(records_by_id):
+    """Prompt for a record type and optional content; return matching record IDs, or None for an unsupported type."""
+    record_type = console.input("Enter record type to delete (A, AAAA, CNAME, TXT, etc.): ").strip().upper()
+    if record_type not in VALID_TYPES:
+        console.print(f"[bold red]Unsupported record type: {record_type}[/bold red]")
+        return None
+    content = console.input("Enter content to match (leave empty to match any): ").strip()
+    return [
+        record_id for record_id, record in records_by_id.items()
+        if record["type"] == record_type and (not content or record["content"] == content)
+    ]
+
+def display_delete_failures(failures):
+    """Display the records that could not be deleted in a formatted table."""
+    from rich.table import Table
+
+    table = Table(title="Failed Deletions")
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Error", style="red")
+
+    for record_id, error in failures:
+        table.add_row(record_id, error)
+    console.print(table)
+
+def bulk_delete_dns_records(zone_id, records_by_id, domain):
+    """Delete several DNS records at once, chosen by ID or by type/content."""
+    display_dns_records(records_by_id.values(), domain)
+    ids_input = console.input("\nEnter the IDs of the records to delete (comma-separated), or press Enter to select by type: ")
+    if ids_input.strip():
+        record_ids = [record_id.strip() for record_id in ids_input.split(",") if record_id.strip()]
+        unknown_ids = [record_id for record_id in record_ids if record_id not in records_by_id]
+        if unknown_ids:
+            console.print(f"[bold red]Record ID not found: {', '.join(unknown_ids)}[/bold red]")
+            return
     else:
+        record_ids = _select_records_by_filter(records_by_id)
+        if record_ids is None:
+            return
+        if not record_ids:
+            console.print("[bold red]No records match.[/bold red]")
+            return
+        display_dns_records((records_by_id[record_id] for record_id in record_ids), domain)
+
+    confirmation = console.input(f"Are you sure you want to delete {len(record_ids)} records? (yes/no): ").lower()
+    if confirmation != 'yes':
         console.print("Deletion cancelled.")
+        return
+
+    failures = delete_dns_records(zone_id, record_ids)
+    invalidate_records_cache()
+    deleted = len(record_ids) - len(failures)
+    console.print(f"\n[bold green]Successfully deleted {deleted} DNS records.[/bold green]")
+    if failures:
+        display_delete_failures(failures)
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Manage Cloudflare DNS records from the terminal.")
+    parser.add_argument("--refresh-zones", action="store_true",
+                        help="ignore the cached zone list and fetch it from Cloudflare")
+    parser.add_argument("--script", type=argparse.FileType("r"), metavar="FILE",
+                        help="read menu choices and answers from FILE, one per line, instead of the terminal")
+    return parser.parse_args()
 
 def main():
     """Main function to run the CLI tool."""
-    if not all([CF_EMAIL, CF_GLOBAL_API_KEY]):
-        console.print("[bold red]Error: Missing credentials. Make sure CF_EMAIL and CF_GLOBAL_API_KEY are set in your .env file.[/bold red]")
+    global console
+    args = parse_args()
+
+    from rich.console import Console
+    console = Console()
+    if not (CF_API_TOKEN or all([CF_EMAIL, CF_GLOBAL_API_KEY])):
+        console.print("[bold red]Error: Missing credentials. Make sure CF_API_TOKEN, or CF_EMAIL and CF_GLOBAL_API_KEY, are set in your .env file.[/bold red]")
         sys.exit(1)
 
-    zones = get_all_zones()
-    selected_zone = select_zone(zones)
-    zone_id = selected_zone["id"]
-    domain = selected_zone["name"]
+    if args.script:
+        # Every prompt reads from stdin, so feeding the script through it lets
+        # one session (zone lookup, connection, record cache) serve all commands.
+        sys.stdin = args.script
+
+    try:
+        run_menu(refresh_zones=args.refresh_zones, show_menu=not args.script)
+    except EOFError:
+        console.print("\nEnd of input, exiting.")
+    finally:
+        if _session is not None:
+            _session.close()
+
+def _choose_zone(state, refresh=False):
+    """Prompt for the domain to manage and store it in the menu state."""
+    selected_zone = select_zone(get_all_zones(refresh=refresh))
+    state["zone_id"] = selected_zone["id"]
+    state["domain"] = selected_zone["name"]
+
+# --- Menu actions ---
+# Each action receives the menu state ({"zone_id", "domain"}) and returns
+# whether the menu loop should continue.
+
+def _list_action(state):
+    """List the DNS records of the current domain."""
+    records = get_dns_records(state["zone_id"])
+    if records:
+        display_dns_records(records, state["domain"])
+    return True
+
+def _add_action(state):
+    """Add a DNS record to the current domain."""
+    add_dns_record(state["zone_id"], state["domain"])
+    return True
+
+def _update_action(state):
+    """Update a DNS record of the current domain."""
+    update_dns_record(state["zone_id"], state["domain"])
+    return True
+
+def _delete_action(state):
+    """Delete a DNS record of the current domain."""
+    delete_dns_record(state["zone_id"], state["domain"])
+    return True
+
+def _bulk_delete_action(state):
+    """Delete several DNS records of the current domain."""
+    records = get_dns_records(state["zone_id"])
+    if records:
+        records_by_id = {r["id"]: r for r in records}
+        bulk_delete_dns_records(state["zone_id"], records_by_id, state["domain"])
+    return True
+
+def _select_zone_action(state):
+    """Switch to another domain."""
+    _choose_zone(state)
+    return True
+
+def _exit_action(state):
+    """Leave the menu loop."""
+    console.print("Exiting.")
+    return False
+
+ACTIONS: dict[str, Callable[[dict], bool]] = {
+    "1": _list_action,
+    "2": _add_action,
+    "3": _update_action,
+    "4": _delete_action,
+    "5": _select_zone_action,
+    "6": _exit_action,
+    "7": _bulk_delete_action,
+}
+
+def run_menu(refresh_zones=False, show_menu=True):
+    """Select a domain and run the menu loop, printing the menu only if show_menu is set."""
+    state = {}
+    _choose_zone(state, refresh=refresh_zones)
     
     while True:
-        console.print(f"\n[bold cyan]Cloudflare DNS Manager for {domain}[/bold cyan]")
-        console.print("1. List DNS Records")
-        console.print("2. Add DNS Record")
-        console.print("3. Update DNS Record")
-        console.print("4. Delete DNS Record")
-        console.print("5. Select Another Domain")
-        console.print("6. Exit")
+        if show_menu:
+            console.print(f"\n[bold cyan]Cloudflare DNS Manager for {state['domain']}[/bold cyan]")
+            console.print("1. List DNS Records")
+            console.print("2. Add DNS Record")
+            console.print("3. Update DNS Record")
+            console.print("4. Delete DNS Record")
+            console.print("5. Select Another Domain")
+            console.print("6. Exit")
+            console.print("7. Bulk Delete DNS Records")
         choice = console.input("Enter your choice: ")
 
-        if choice == '1':
-            records = get_dns_records(zone_id)
-            if records:
-                display_dns_records(records, domain)
-        elif choice == '2':
-            add_dns_record(zone_id, domain)
-        elif choice == '3':
-            records = get_dns_records(zone_id)
-            if records:
-                update_dns_record(zone_id, records, domain)
-        elif choice == '4':
-            records = get_dns_records(zone_id)
-            if records:
-                delete_dns_record(zone_id, records, domain)
-        elif choice == '5':
-            zones = get_all_zones()
-            selected_zone = select_zone(zones)
-            zone_id = selected_zone["id"]
-            domain = selected_zone["name"]
-        elif choice == '6':
-            console.print("Exiting.")
-            break
-        else:
+        handler = ACTIONS.get(choice)
+        if handler is None:
             console.print("[bold red]Invalid choice. Please try again.[/bold red]")
+        elif not handler(state):
+            break
 
 if __name__ == "__main__":
     main()